@@ -0,0 +1,21 @@
+from setuptools import Extension, setup
+
+# The Cython kernels are an optional speed-up; without Cython the package
+# falls back to quaternion._kernels.
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    # optional: a failed compile (e.g. no C compiler) does not fail the install
+    ext_modules = cythonize(  # type: ignore[no-untyped-call]
+        [
+            Extension(
+                "quaternion._ckernels",
+                ["src/quaternion/_ckernels.pyx"],
+                optional=True,
+            )
+        ]
+    )
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,94 @@
+"""
+Loop kernels behind the batch arithmetic in batch.py.
+
+They loop over component arrays and are compiled with Numba when it is
+installed. Without Numba they run as regular Python loops, far slower than the
+NumPy expressions in batch.py, so only call them when HAS_NUMBA is set.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+try:
+    from numba import njit  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # Numba is optional
+    HAS_NUMBA = False
+
+    def njit(*args: Any, **kwargs: Any) -> Callable[[_F], _F]:  # type: ignore[no-redef]
+        def decorator(func: _F) -> _F:
+            return func
+
+        return decorator
+
+else:
+    HAS_NUMBA = True
+
+
+@njit(cache=True, fastmath=True)
+def qmul_soa(
+    pw: npt.NDArray[np.float64],
+    px: npt.NDArray[np.float64],
+    py: npt.NDArray[np.float64],
+    pz: npt.NDArray[np.float64],
+    qw: npt.NDArray[np.float64],
+    qx: npt.NDArray[np.float64],
+    qy: npt.NDArray[np.float64],
+    qz: npt.NDArray[np.float64],
+    rw: npt.NDArray[np.float64],
+    rx: npt.NDArray[np.float64],
+    ry: npt.NDArray[np.float64],
+    rz: npt.NDArray[np.float64],
+) -> None:
+    """
+    Element-wise Hamilton products r[i] = p[i] * q[i] over component arrays.
+    Numba compiles a separate specialization per dtype, so float32 arrays get
+    twice the SIMD lanes of float64.
+
+    Meant to be compiled: Numba turns the loop into packed SIMD (AVX2/FMA
+    where available) with all four outputs computed in one pass. Only use it
+    when HAS_NUMBA is set.
+    """
+    for i in range(pw.shape[0]):
+        aw, ax, ay, az = pw[i], px[i], py[i], pz[i]
+        bw, bx, by, bz = qw[i], qx[i], qy[i], qz[i]
+
+        rw[i] = aw * bw - ax * bx - ay * by - az * bz
+        rx[i] = aw * bx + ax * bw + ay * bz - az * by
+        ry[i] = aw * by - ax * bz + ay * bw + az * bx
+        rz[i] = aw * bz + ax * by - ay * bx + az * bw
+
+
+@njit(cache=True, fastmath=True)
+def rotate_vec3_many(
+    w: float,
+    x: float,
+    y: float,
+    z: float,
+    factor: float,
+    v: npt.NDArray[np.float64],
+    out: npt.NDArray[np.float64],
+) -> None:
+    """
+    Rotates every row of the (N, 3) array v by the quaternion q into out.
+
+    Same formula as rotate_vec3, fused into a single pass: the quaternion and
+    the factor 2 / |q|^2, computed by the caller, stay in registers and only
+    v is streamed through. Only use it when HAS_NUMBA is set.
+    """
+    for i in range(v.shape[0]):
+        vx, vy, vz = v[i, 0], v[i, 1], v[i, 2]
+
+        tx = factor * (y * vz - z * vy)
+        ty = factor * (z * vx - x * vz)
+        tz = factor * (x * vy - y * vx)
+
+        out[i, 0] = vx + w * tx + y * tz - z * ty
+        out[i, 1] = vy + w * ty + z * tx - x * tz
+        out[i, 2] = vz + w * tz + x * ty - y * tx
@@ -0,0 +1,117 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Cython build of the scalar kernels in _kernels.py (the array kernels in
+_array_kernels.py stay Numba-only).
+
+Same signatures and results; compiled with typed doubles so that a call from
+Python costs a C function call instead of interpreted bytecode. Division keeps
+Python semantics (ZeroDivisionError for a zero quaternion) like _kernels.py.
+"""
+
+from libc.math cimport fabs, fmax, isinf, sqrt
+
+
+cpdef tuple qmul(
+    double aw,
+    double ax,
+    double ay,
+    double az,
+    double bw,
+    double bx,
+    double by,
+    double bz,
+):
+    """
+    Hamilton product a * b.
+    """
+    return (
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    )
+
+
+cpdef tuple qinverse(double w, double x, double y, double z):
+    """
+    Inverse of a quaternion, conj(q) / |q|^2.
+    """
+    cdef double n2 = w * w + x * x + y * y + z * z
+    if isinf(n2):
+        raise OverflowError("|q|^2 of the quaternion overflows")
+
+    cdef double inv = 1.0 / n2
+
+    return (w * inv, -x * inv, -y * inv, -z * inv)
+
+
+cpdef tuple qnormalize(double w, double x, double y, double z):
+    """
+    Quaternion scaled to unit norm.
+    """
+    # scaled by the largest component, so |q|^2 neither overflows nor
+    # underflows (like math.hypot in _kernels.py)
+    cdef double m = fmax(fmax(fabs(w), fabs(x)), fmax(fabs(y), fabs(z)))
+    w /= m
+    x /= m
+    y /= m
+    z /= m
+
+    cdef double inv = 1.0 / sqrt(w * w + x * x + y * y + z * z)
+
+    return (w * inv, x * inv, y * inv, z * inv)
+
+
+cpdef tuple rotate_vec3(
+    double w,
+    double x,
+    double y,
+    double z,
+    double vx,
+    double vy,
+    double vz,
+):
+    """
+    Rotates the vector v by the quaternion q, i.e. q * v * q^-1.
+
+    Uses v' = v + w * t + q_v x t with t = 2 * (q_v x v) / |q|^2.
+    """
+    cdef double n2 = w * w + x * x + y * y + z * z
+    if isinf(n2):
+        raise OverflowError("|q|^2 of the quaternion overflows")
+
+    # for a unit quaternion the inverse is the conjugate and |q|^2 drops out
+    cdef double factor = 2.0 if n2 == 1.0 else 2.0 / n2
+
+    cdef double tx = factor * (y * vz - z * vy)
+    cdef double ty = factor * (z * vx - x * vz)
+    cdef double tz = factor * (x * vy - y * vx)
+
+    return (
+        vx + w * tx + y * tz - z * ty,
+        vy + w * ty + z * tx - x * tz,
+        vz + w * tz + x * ty - y * tx,
+    )
+
+
+cpdef tuple rotate_vec3_unit(
+    double w,
+    double x,
+    double y,
+    double z,
+    double vx,
+    double vy,
+    double vz,
+):
+    """
+    rotate_vec3 for a quaternion known to have unit norm, skipping the norm.
+    """
+    cdef double tx = 2.0 * (y * vz - z * vy)
+    cdef double ty = 2.0 * (z * vx - x * vz)
+    cdef double tz = 2.0 * (x * vy - y * vx)
+
+    return (
+        vx + w * tx + y * tz - z * ty,
+        vy + w * ty + z * tx - x * tz,
+        vz + w * tz + x * ty - y * tx,
+    )
@@ -0,0 +1,113 @@
+"""
+Scalar kernels behind the Quaternion arithmetic.
+
+The kernels operate on plain components and return tuples. They are plain
+Python, so importing them costs neither NumPy nor Numba; _ckernels.pyx holds a
+compiled build with the same signatures.
+"""
+
+from math import hypot, isinf
+
+
+def qmul(
+    aw: float,
+    ax: float,
+    ay: float,
+    az: float,
+    bw: float,
+    bx: float,
+    by: float,
+    bz: float,
+) -> tuple[float, float, float, float]:
+    """
+    Hamilton product a * b.
+    """
+    # float() so that int components give float results in every backend
+    return (
+        float(aw * bw - ax * bx - ay * by - az * bz),
+        float(aw * bx + ax * bw + ay * bz - az * by),
+        float(aw * by - ax * bz + ay * bw + az * bx),
+        float(aw * bz + ax * by - ay * bx + az * bw),
+    )
+
+
+def qinverse(
+    w: float, x: float, y: float, z: float
+) -> tuple[float, float, float, float]:
+    """
+    Inverse of a quaternion, conj(q) / |q|^2.
+    """
+    n2 = w * w + x * x + y * y + z * z
+    if isinf(n2):
+        raise OverflowError("|q|^2 of the quaternion overflows")
+
+    inv = 1.0 / n2
+
+    return (w * inv, -x * inv, -y * inv, -z * inv)
+
+
+def qnormalize(
+    w: float, x: float, y: float, z: float
+) -> tuple[float, float, float, float]:
+    """
+    Quaternion scaled to unit norm.
+    """
+    # hypot scales internally, so |q|^2 neither overflows nor underflows
+    inv = 1.0 / hypot(w, x, y, z)
+
+    return (w * inv, x * inv, y * inv, z * inv)
+
+
+def rotate_vec3(
+    w: float,
+    x: float,
+    y: float,
+    z: float,
+    vx: float,
+    vy: float,
+    vz: float,
+) -> tuple[float, float, float]:
+    """
+    Rotates the vector v by the quaternion q, i.e. q * v * q^-1.
+
+    Uses v' = v + w * t + q_v x t with t = 2 * (q_v x v) / |q|^2.
+    """
+    n2 = w * w + x * x + y * y + z * z
+    if isinf(n2):
+        raise OverflowError("|q|^2 of the quaternion overflows")
+
+    # for a unit quaternion the inverse is the conjugate and |q|^2 drops out
+    factor = 2.0 if n2 == 1.0 else 2.0 / n2
+
+    tx = factor * (y * vz - z * vy)
+    ty = factor * (z * vx - x * vz)
+    tz = factor * (x * vy - y * vx)
+
+    return (
+        vx + w * tx + y * tz - z * ty,
+        vy + w * ty + z * tx - x * tz,
+        vz + w * tz + x * ty - y * tx,
+    )
+
+
+def rotate_vec3_unit(
+    w: float,
+    x: float,
+    y: float,
+    z: float,
+    vx: float,
+    vy: float,
+    vz: float,
+) -> tuple[float, float, float]:
+    """
+    rotate_vec3 for a quaternion known to have unit norm, skipping the norm.
+    """
+    tx = 2.0 * (y * vz - z * vy)
+    ty = 2.0 * (z * vx - x * vz)
+    tz = 2.0 * (x * vy - y * vx)
+
+    return (
+        vx + w * tx + y * tz - z * ty,
+        vy + w * ty + z * tx - x * tz,
+        vz + w * tz + x * ty - y * tx,
+    )
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from math import isinf
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from ._array_kernels import HAS_NUMBA, qmul_soa, rotate_vec3_many
+from .quaternion import Quaternion
+from .vector3 import Vector3
+
+
+def multiply_batch(
+    p: npt.NDArray[np.float64], q: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """
+    Hamilton products of two batches of quaternions.
+
+    Parameters
+    ----------
+    p, q: np.ndarray
+        Arrays of shape (N, 4) holding quaternions as rows (w, x, y, z).
+
+    Returns
+    -------
+    r: np.ndarray
+        Array of shape (N, 4) with r[i] = p[i] * q[i], in the common dtype of
+        p and q (float32 inputs stay float32).
+    """
+    pw, px, py, pz = p.T
+    qw, qx, qy, qz = q.T
+
+    return np.stack(
+        [
+            pw * qw - px * qx - py * qy - pz * qz,
+            pw * qx + px * qw + py * qz - pz * qy,
+            pw * qy - px * qz + py * qw + pz * qx,
+            pw * qz + px * qy - py * qx + pz * qw,
+        ],
+        axis=1,
+    )
+
+
+def rotate_vectors_batch(
+    q: npt.NDArray[np.float64], v: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """
+    Rotates a batch of vectors by a batch of quaternions, i.e. q * v * q^-1.
+
+    Parameters
+    ----------
+    q: np.ndarray
+        Array of shape (N, 4) holding quaternions as rows (w, x, y, z), or of
+        shape (4,) to rotate all vectors by the same quaternion.
+    v: np.ndarray
+        Array of shape (N, 3) holding vectors as rows (x, y, z).
+
+    Returns
+    -------
+    v_rotated: np.ndarray
+        Array of shape (N, 3) with the rotated vectors.
+    """
+    if q.ndim == 1:
+        return _rotate_vectors_single(q, v)
+
+    w = q[..., :1]
+    qv = q[..., 1:]
+
+    n2: npt.NDArray[np.float64] = np.einsum("...i,...i->...", q, q)[..., np.newaxis]
+
+    t = np.cross(qv, v) * (2.0 / n2)
+
+    return v + w * t + np.cross(qv, t)
+
+
+def _rotate_vectors_single(
+    q: npt.NDArray[np.float64], v: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """
+    rotate_vectors_batch for a single quaternion: its components are read once
+    and all vectors go through one fused pass.
+    """
+    w, x, y, z = q.tolist()
+    # at least float64 for integer inputs, float32 stays float32
+    out = np.empty_like(v, dtype=np.result_type(q, v, 1.0))
+
+    n2 = w * w + x * x + y * y + z * z
+    if isinf(n2):
+        raise OverflowError("|q|^2 of the quaternion overflows")
+
+    # for a unit quaternion the inverse is the conjugate and |q|^2 drops out
+    factor = 2.0 if n2 == 1.0 else 2.0 / n2
+
+    if HAS_NUMBA:
+        rotate_vec3_many(w, x, y, z, factor, v, out)
+        return out
+
+    vx, vy, vz = v[:, 0], v[:, 1], v[:, 2]
+
+    tx = factor * (y * vz - z * vy)
+    ty = factor * (z * vx - x * vz)
+    tz = factor * (x * vy - y * vx)
+
+    out[:, 0] = vx + w * tx + y * tz - z * ty
+    out[:, 1] = vy + w * ty + z * tx - x * tz
+    out[:, 2] = vz + w * tz + x * ty - y * tx
+
+    return out
+
+
+class QuaternionArray:
+    """
+    A batch of quaternions stored as four parallel component arrays
+    (structure of arrays), so arithmetic runs vectorized over all of them.
+
+    Components are float64 by default. Pass dtype=np.float32 to halve the
+    memory traffic where single precision is enough; results of the batch
+    operations keep the dtype of their operands.
+    """
+
+    __slots__ = ("w", "x", "y", "z")
+
+    def __init__(
+        self,
+        w: npt.ArrayLike,
+        x: npt.ArrayLike,
+        y: npt.ArrayLike,
+        z: npt.ArrayLike,
+        dtype: npt.DTypeLike = np.float64,
+    ) -> None:
+        self.w = np.asarray(w, dtype=dtype)
+        self.x = np.asarray(x, dtype=dtype)
+        self.y = np.asarray(y, dtype=dtype)
+        self.z = np.asarray(z, dtype=dtype)
+
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        return self.w.dtype
+
+    def __len__(self) -> int:
+        return len(self.w)
+
+    def multiply(self, other: QuaternionArray) -> QuaternionArray:
+        """
+        Element-wise Hamilton products self[i] * other[i].
+        """
+        aw, ax, ay, az = self.w, self.x, self.y, self.z
+        bw, bx, by, bz = other.w, other.x, other.y, other.z
+
+        dtype = np.result_type(aw, bw)
+
+        # the loop kernel does no broadcasting or bounds checks, so it only
+        # takes 1-D operands of one shape; anything else goes through NumPy
+        shape = aw.shape
+        if (
+            HAS_NUMBA
+            and aw.ndim == 1
+            and all(c.shape == shape for c in (ax, ay, az, bw, bx, by, bz))
+        ):
+            rw, rx, ry, rz = (np.empty_like(aw, dtype=dtype) for _ in range(4))
+            qmul_soa(aw, ax, ay, az, bw, bx, by, bz, rw, rx, ry, rz)
+
+            return QuaternionArray(rw, rx, ry, rz, dtype=dtype)
+
+        return QuaternionArray(
+            aw * bw - ax * bx - ay * by - az * bz,
+            aw * bx + ax * bw + ay * bz - az * by,
+            aw * by - ax * bz + ay * bw + az * bx,
+            aw * bz + ax * by - ay * bx + az * bw,
+            dtype=dtype,
+        )
+
+    def normalize(self) -> QuaternionArray:
+        """
+        Normalizes every quaternion of the batch.
+        """
+        w, x, y, z = self.w, self.x, self.y, self.z
+        inv = 1.0 / np.sqrt(w * w + x * x + y * y + z * z)
+
+        return QuaternionArray(w * inv, x * inv, y * inv, z * inv, dtype=w.dtype)
+
+    def rotate(self, v: npt.NDArray[np.floating[Any]]) -> npt.NDArray[np.floating[Any]]:
+        """
+        Rotates vectors by the quaternions, i.e. q[i] * v[i] * q[i]^-1.
+
+        Parameter
+        ---------
+        v: np.ndarray
+            Array of shape (N, 3) holding vectors as rows (x, y, z).
+
+        Returns
+        -------
+        v_rotated: np.ndarray
+            Array of shape (N, 3) with the rotated vectors.
+        """
+        w, x, y, z = self.w, self.x, self.y, self.z
+        qv = np.stack((x, y, z), axis=-1)
+
+        n2: npt.NDArray[np.floating[Any]] = w * w + x * x + y * y + z * z
+
+        t = np.cross(qv, v) * (2.0 / n2)[:, np.newaxis]
+
+        v_rotated: npt.NDArray[np.floating[Any]] = (
+            v + w[:, np.newaxis] * t + np.cross(qv, t)
+        )
+
+        return v_rotated
+
+    def iter(self) -> Iterator[Quaternion]:
+        """
+        Iterates over the batch as scalar quaternions.
+        """
+        for w, x, y, z in zip(
+            self.w.tolist(), self.x.tolist(), self.y.tolist(), self.z.tolist()
+        ):
+            yield Quaternion(w, x, y, z)
+
+    def __repr__(self) -> str:
+        """
+        Returns a detailed string representation of the quaternion batch.
+        """
+        return f"QuaternionArray({self.w!r}, {self.x!r}, {self.y!r}, {self.z!r})"
+
+    @staticmethod
+    def from_axis_angles(
+        axis: Vector3, angles: npt.ArrayLike, dtype: npt.DTypeLike = np.float64
+    ) -> QuaternionArray:
+        """
+        Constructs the rotation quaternions for many angles (rad) about one
+        axis, evaluating cos/sin of the half angles vectorized.
+        The axis does not need to be normalized.
+        """
+        half_angles = np.asarray(angles, dtype=dtype) * 0.5
+
+        s = np.sin(half_angles)
+        if axis._norm_sq() != 1:
+            s /= axis.norm()
+
+        return QuaternionArray(
+            np.cos(half_angles), s * axis.x, s * axis.y, s * axis.z, dtype=dtype
+        )
+
+    @staticmethod
+    def from_list(
+        quaternions: Iterable[Quaternion], dtype: npt.DTypeLike = np.float64
+    ) -> QuaternionArray:
+        """
+        Packs scalar quaternions into a batch.
+        """
+        components = [q.get() for q in quaternions]
+        if not components:
+            return QuaternionArray([], [], [], [], dtype=dtype)
+
+        w, x, y, z = zip(*components)
+
+        return QuaternionArray(w, x, y, z, dtype=dtype)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from .batch import rotate_vectors_batch
+from .quaternion import Quaternion
+
+try:
+    import cupy as cp  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # CuPy is optional
+    cp = None
+
+_THREADS_PER_BLOCK = 256
+
+# v' = v + w * t + q_v x t with t = 2 * (q_v x v), for a unit quaternion q
+_ROTATE_SOURCE = r"""
+extern "C" __global__
+void rotate_kernel(const double qw, const double qx, const double qy,
+                   const double qz, const double* vin, double* vout,
+                   const long long n)
+{
+    const long long i = (long long)blockDim.x * blockIdx.x + threadIdx.x;
+    if (i >= n) {
+        return;
+    }
+
+    const double vx = vin[3 * i];
+    const double vy = vin[3 * i + 1];
+    const double vz = vin[3 * i + 2];
+
+    const double tx = 2.0 * (qy * vz - qz * vy);
+    const double ty = 2.0 * (qz * vx - qx * vz);
+    const double tz = 2.0 * (qx * vy - qy * vx);
+
+    vout[3 * i] = vx + qw * tx + qy * tz - qz * ty;
+    vout[3 * i + 1] = vy + qw * ty + qz * tx - qx * tz;
+    vout[3 * i + 2] = vz + qw * tz + qx * ty - qy * tx;
+}
+"""
+
+
+@cache
+def _rotate_kernel() -> Any:
+    """
+    Returns the compiled rotation kernel, or None if no CUDA device is usable.
+    """
+    if cp is None:
+        return None
+
+    try:
+        if cp.cuda.runtime.getDeviceCount() == 0:
+            return None
+    except cp.cuda.runtime.CUDARuntimeError:
+        return None
+
+    return cp.RawKernel(_ROTATE_SOURCE, "rotate_kernel")
+
+
+def rotate_vectors_cuda(q: Quaternion, v: Any) -> Any:
+    """
+    Rotates many vectors by one quaternion on the GPU, i.e. q * v[i] * q^-1.
+
+    Falls back to rotate_vectors_batch on the CPU when CuPy or a CUDA device
+    is not available.
+
+    Parameters
+    ----------
+    q: Quaternion
+        The rotation. It does not need to be normalized.
+    v: np.ndarray | cupy.ndarray
+        Array of shape (N, 3) holding vectors as rows (x, y, z).
+
+    Returns
+    -------
+    v_rotated: np.ndarray | cupy.ndarray
+        Array of shape (N, 3) with the rotated vectors, on the same device
+        as v.
+    """
+    kernel = _rotate_kernel()
+    if kernel is None:
+        v_host: npt.NDArray[np.float64] = np.asarray(v, dtype=np.float64)
+        return rotate_vectors_batch(q.to_array(), v_host)
+
+    inv = 1.0 / q.norm()
+
+    on_device = isinstance(v, cp.ndarray)
+    vin = cp.ascontiguousarray(cp.asarray(v, dtype=cp.float64))
+    vout = cp.empty_like(vin)
+
+    n = vin.shape[0]
+    if n == 0:
+        return vout if on_device else cp.asnumpy(vout)
+
+    blocks = (n + _THREADS_PER_BLOCK - 1) // _THREADS_PER_BLOCK
+
+    kernel(
+        (blocks,),
+        (_THREADS_PER_BLOCK,),
+        (
+            np.float64(q.w * inv),
+            np.float64(q.x * inv),
+            np.float64(q.y * inv),
+            np.float64(q.z * inv),
+            vin,
+            vout,
+            np.int64(n),
+        ),
+    )
+
+    return vout if on_device else cp.asnumpy(vout)
@@ -1,12 +1,34 @@
 from __future__ import annotations
 
-from math import cos, pi, sin, sqrt
-from typing import Callable
-
+from math import cos, hypot, pi, sin
+from typing import TYPE_CHECKING, Any, Callable, Self
+
+if TYPE_CHECKING:  # NumPy is only imported by the array conversions
+    import numpy as np
+    import numpy.typing as npt
+
+try:  # compiled Cython kernels are optional, see setup.py
+    from ._ckernels import (  # type: ignore[import-not-found]
+        qinverse,
+        qmul,
+        qnormalize,
+        rotate_vec3,
+        rotate_vec3_unit,
+    )
+except ImportError:
+    from ._kernels import (
+        qinverse,
+        qmul,
+        qnormalize,
+        rotate_vec3,
+        rotate_vec3_unit,
+    )
 from .vector3 import Vector3
 
 
 class Quaternion:
+    __slots__ = ("w", "x", "y", "z")
+
     def __init__(
         self, w: int | float, x: int | float, y: int | float, z: int | float
     ) -> None:
@@ -16,7 +38,7 @@ def __init__(
         self.z = z
 
     def norm(self) -> float:
-        return sqrt(self.w**2 + self.x**2 + self.y**2 + self.z**2)
+        return hypot(self.w, self.x, self.y, self.z)
 
     def scale(self, factor: int | float) -> Quaternion:
         """
@@ -40,9 +62,7 @@ def normalize(self) -> Quaternion:
         """
         Normalizes the quaternion.
         """
-        norm = self.norm()
-
-        return self.scale(1 / norm)
+        return Quaternion(*qnormalize(self.w, self.x, self.y, self.z))
 
     def add(self, other: Quaternion) -> Quaternion:
         """
@@ -62,39 +82,35 @@ def subtract(self, other: Quaternion) -> Quaternion:
 
     def multiply(self, other: Quaternion) -> Quaternion:
         return Quaternion(
-            self.w * other.w - self.x * other.x - self.y * other.y - self.z * other.z,
-            self.w * other.x + self.x * other.w + self.y * other.z - self.z * other.y,
-            self.w * other.y - self.x * other.z + self.y * other.w + self.z * other.x,
-            self.w * other.z + self.x * other.y - self.y * other.x + self.z * other.w,
+            *qmul(self.w, self.x, self.y, self.z, other.w, other.x, other.y, other.z)
         )
 
+    def _multiply_vector(self, v: Vector3) -> Quaternion:
+        """
+        Multiplies with a vector taken as the pure quaternion (0, v).
+        """
+        return Quaternion(*qmul(self.w, self.x, self.y, self.z, 0, v.x, v.y, v.z))
+
     def conjugate(self) -> Quaternion:
         return Quaternion(self.w, -self.x, -self.y, -self.z)
 
     def inverse(self) -> Quaternion:
-        norm_squared = self.norm() ** 2
-        q_conj = self.conjugate()
-        return q_conj.scale(1 / norm_squared)
+        return Quaternion(*qinverse(self.w, self.x, self.y, self.z))
 
     def transform(self, v: Vector3) -> Vector3:
-        p = Quaternion(
-            0, v.x, v.y, v.z
-        )  # convert Vector3 to Quaternion with zero real part
-
-        if self.norm() != 1:
-            t = (
-                self * p * self.inverse()
-            )  # apply transformation for quaternion of length other than 1
-        else:
-            t = self * p * self.conjugate()  # apply transformation for unit quaternion
+        """
+        Rotates a vector by the quaternion, i.e. q * v * q^-1.
 
-        return Vector3(t.x, t.y, t.z)
+        Uses the vector form v' = v + w * t + q_v x t with t = 2 * (q_v x v) / |q|^2,
+        which avoids the two Hamilton products of the quaternion sandwich.
+        """
+        return Vector3(*rotate_vec3(self.w, self.x, self.y, self.z, v.x, v.y, v.z))
 
-    def copy(self) -> Quaternion:
+    def copy(self) -> Self:
         """
-        Returns a copy of the quaternion.
+        Returns a copy of the quaternion, of the same class.
         """
-        return Quaternion(self.w, self.x, self.y, self.z)
+        return type(self)(self.w, self.x, self.y, self.z)
 
     def get(self) -> tuple[int | float, int | float, int | float, int | float]:
         """
@@ -102,6 +118,14 @@ def get(self) -> tuple[int | float, int | float, int | float, int | float]:
         """
         return (self.w, self.x, self.y, self.z)
 
+    def to_array(self) -> npt.NDArray[np.float64]:
+        """
+        Returns the components of the quaternion as an array (w, x, y, z).
+        """
+        import numpy as np
+
+        return np.array([self.w, self.x, self.y, self.z], dtype=np.float64)
+
     def __add__(self, other: Quaternion) -> Quaternion:
         """
         Adds two quaternions.
@@ -119,11 +143,17 @@ def __mul__(self, other: int | float | Vector3 | Quaternion) -> Quaternion:
         Python magic method for quaternion multiplication with a constant
         or another quaternion.
         """
+        name = _MUL_DISPATCH.get(type(other))
+        if name is not None:
+            # looked up on self so that subclass overrides are honored
+            method: Callable[[Any], Quaternion] = getattr(self, name)
+            return method(other)
+
+        # subclasses of the dispatched types (e.g. bool, numpy.float64)
         if isinstance(other, (int, float)):
             return self.scale(other)
         elif isinstance(other, Vector3):
-            q_other = Quaternion(0, other.x, other.y, other.z)
-            return self.multiply(q_other)
+            return self._multiply_vector(other)
         elif isinstance(other, Quaternion):
             return self.multiply(other)
         else:
@@ -163,11 +193,37 @@ def __eq__(self, other: object) -> bool:
         if not isinstance(other, Quaternion):
             return NotImplemented
 
+        if self is other:
+            return True
+
+        return (
+            self.w == other.w
+            and self.x == other.x
+            and self.y == other.y
+            and self.z == other.z
+        )
+
+    def approx_equal(self, other: Quaternion, tol: float = 1e-9) -> bool:
+        """
+        Compares two quaternions component-wise within an absolute tolerance.
+
+        Parameters
+        ----------
+        other: Quaternion
+            The quaternion to compare with.
+        tol: float
+            Maximum absolute difference per component. Default: 1e-9
+
+        Returns
+        -------
+        equal: bool
+            True if all components differ by at most tol.
+        """
         return (
-            self.w == self.w
-            and self.x == self.x
-            and self.y == self.y
-            and self.z == self.z
+            abs(self.w - other.w) <= tol
+            and abs(self.x - other.x) <= tol
+            and abs(self.y - other.y) <= tol
+            and abs(self.z - other.z) <= tol
         )
 
     def _toString(self, precision: int = 2) -> str:
@@ -180,21 +236,14 @@ def _toString(self, precision: int = 2) -> str:
         Returns:
             A formatted string representation of the quaternion.
         """
-        # Lambda to format a component with proper sign
-        format_component: Callable[[int | float, str], str] = lambda value, suffix: (
-            f" {'-' if value < 0 else '+'} {abs(value):.{precision}f}{suffix}"
+        # Scalar component followed by the vector components with proper sign
+        return (
+            f"{self.w:.{precision}f}"
+            f" {'-' if self.x < 0 else '+'} {abs(self.x):.{precision}f}i"
+            f" {'-' if self.y < 0 else '+'} {abs(self.y):.{precision}f}j"
+            f" {'-' if self.z < 0 else '+'} {abs(self.z):.{precision}f}k"
         )
 
-        # Start with the scalar component
-        result = f"{self.w:.{precision}f}"
-
-        # Add vector component
-        result += format_component(self.x, "i")
-        result += format_component(self.y, "j")
-        result += format_component(self.z, "k")
-
-        return result
-
     def __str__(self) -> str:
         """
         Returns a string representation of the quaternion (calls _toString with default precision).
@@ -205,7 +254,7 @@ def __repr__(self) -> str:
         """
         Returns a detailed string representation of the quaternion.
         """
-        return f"Quaternion({self.w}, {self.x}, {self.y}, {self.z})"
+        return f"{type(self).__name__}({self.w}, {self.x}, {self.y}, {self.z})"
 
     @property
     def scalar_part(self) -> int | float:
@@ -216,15 +265,57 @@ def vector_part(self) -> Vector3:
         return Vector3(self.x, self.y, self.z)
 
     @staticmethod
-    def from_axis_angle(axis: Vector3, angle: int | float) -> Quaternion:
-        if axis.length() != 1:
-            axis = axis.normalize()
-
+    def from_axis_angle(axis: Vector3, angle: int | float) -> UnitQuaternion:
+        """
+        Constructs the rotation quaternion for an angle (rad) about an axis.
+        The axis does not need to be normalized.
+        """
         half_angle = angle / 2
 
-        return Quaternion(
-            cos(half_angle),
-            sin(half_angle) * axis.x,
-            sin(half_angle) * axis.y,
-            sin(half_angle) * axis.z,
-        )
+        # fold the axis normalization into the sine factor; the squared length
+        # only decides whether the axis is already unit
+        s = sin(half_angle)
+        if axis._norm_sq() != 1:
+            s /= axis.norm()
+
+        return UnitQuaternion(cos(half_angle), s * axis.x, s * axis.y, s * axis.z)
+
+    @staticmethod
+    def from_array(array: npt.ArrayLike) -> Quaternion:
+        """
+        Constructs a quaternion from an array-like of components (w, x, y, z).
+        """
+        import numpy as np
+
+        w, x, y, z = np.asarray(array, dtype=np.float64).tolist()
+
+        return Quaternion(w, x, y, z)
+
+
+class UnitQuaternion(Quaternion):
+    """
+    A quaternion known to have unit norm, e.g. a rotation built by
+    Quaternion.from_axis_angle.
+
+    The norm is not checked; constructing one from non-unit components gives
+    wrong rotations. Arithmetic results are plain Quaternion objects.
+    """
+
+    __slots__ = ()
+
+    def transform(self, v: Vector3) -> Vector3:
+        """
+        Rotates a vector by the quaternion, i.e. q * v * q^*.
+        """
+        return Vector3(*rotate_vec3_unit(self.w, self.x, self.y, self.z, v.x, v.y, v.z))
+
+
+# Exact-type dispatch for Quaternion.__mul__, avoiding the isinstance chain
+# for the common operand types; maps the operand type to the method name
+_MUL_DISPATCH: dict[type, str] = {
+    int: "scale",
+    float: "scale",
+    Vector3: "_multiply_vector",
+    Quaternion: "multiply",
+    UnitQuaternion: "multiply",
+}
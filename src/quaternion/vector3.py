@@ -1,8 +1,14 @@
-from math import acos, pi, sqrt
-from typing import Callable
+from math import acos, hypot, pi
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # NumPy is only imported for array arguments
+    import numpy as np
+    import numpy.typing as npt
 
 
 class Vector3:
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: int | float, y: int | float, z: int | float) -> None:
         self.x = x
         self.y = y
@@ -28,7 +34,7 @@ def norm(self, norm_type: int | str = 2) -> float:
             if norm_type == 1:
                 return abs(self.x) + abs(self.y) + abs(self.z)
             elif norm_type == 2:
-                return sqrt(self.x**2 + self.y**2 + self.z**2)
+                return hypot(self.x, self.y, self.z)
             else:
                 raise ValueError(
                     f'norm_type must be either 1, 2, or "inf". Got {norm_type}'
@@ -38,6 +44,13 @@ def norm(self, norm_type: int | str = 2) -> float:
                 f"norm_type must be of type int or str. Got {type(norm_type)}"
             )
 
+    def _norm_sq(self) -> float:
+        """
+        Squared 2-norm of the vector, without the square root. Only for
+        checks on |v|^2 itself; it overflows long before norm() does.
+        """
+        return self.x * self.x + self.y * self.y + self.z * self.z
+
     def scale(self, factor: int | float) -> "Vector3":
         """
         Scales the vector by the given factor.
@@ -58,9 +71,9 @@ def normalize(self) -> "Vector3":
         """
         Normalizes the vector.
         """
-        norm = self.norm(2)
+        inv = 1.0 / self.norm()
 
-        return self.scale(1 / norm)
+        return Vector3(self.x * inv, self.y * inv, self.z * inv)
 
     def add(self, other: "Vector3") -> "Vector3":
         """
@@ -84,11 +97,10 @@ def cross(self, other: "Vector3") -> "Vector3":
         """
         Calculates cross product of two vectors.
         """
-        return Vector3(
-            self.y * other.z - self.z * other.y,
-            self.z * other.x - self.x * other.z,
-            self.x * other.y - self.y * other.x,
-        )
+        ax, ay, az = self.x, self.y, self.z
+        bx, by, bz = other.x, other.y, other.z
+
+        return Vector3(ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx)
 
     def angle(self, other: "Vector3", unit: str = "rad") -> float:
         """
@@ -180,16 +192,12 @@ def _to_string(self, precision: int = 2) -> str:
         """
         Constructs a string representation for vector with a precision (Default = 2).
         """
-        format_component: Callable[[int | float, str], str] = lambda value, suffix: (
-            f" {'-' if value < 0 else '+'} {abs(value):.{precision}f}{suffix}"
+        return (
+            f"{self.x:.{precision}f}e_x"
+            f" {'-' if self.y < 0 else '+'} {abs(self.y):.{precision}f}e_y"
+            f" {'-' if self.z < 0 else '+'} {abs(self.z):.{precision}f}e_z"
         )
 
-        result = f"{self.x:.{precision}f}e_x"
-        result += format_component(self.y, "e_y")
-        result += format_component(self.z, "e_z")
-
-        return result
-
     def __str__(self) -> str:
         """
         Returns a string representation of the vector (calls _toString with default precision).
@@ -202,6 +210,22 @@ def __repr__(self) -> str:
         """
         return f"Vector3({self.x}, {self.y}, {self.z})"
 
+    def __array__(
+        self, dtype: "npt.DTypeLike | None" = None, copy: bool | None = None
+    ) -> "npt.NDArray[Any]":
+        """
+        NumPy array protocol, so that np.asarray(v) gives the array (x, y, z).
+
+        The components are not stored in an array, so a new one is always
+        created and copy=False cannot be honored.
+        """
+        if copy is False:
+            raise ValueError("Vector3 cannot be converted to an array without a copy")
+
+        import numpy as np
+
+        return np.array((self.x, self.y, self.z), dtype=dtype)
+
     @staticmethod
     def from_plane(
         point1: tuple[int | float, int | float, int | float],
@@ -224,34 +248,73 @@ def from_plane(
 # -------------------------------------------------------------------------------------
 # Module-level helper functions
 # -------------------------------------------------------------------------------------
-def dot(v1: Vector3, v2: Vector3) -> float:
-    return v1.dot(v2)
+def dot(
+    v1: "Vector3 | npt.NDArray[np.float64]", v2: "Vector3 | npt.NDArray[np.float64]"
+) -> "float | npt.NDArray[np.float64]":
+    """
+    Calculates dot products of two vectors, or row-wise of two (N, 3) arrays.
+    """
+    if isinstance(v1, Vector3) and isinstance(v2, Vector3):
+        return v1.x * v2.x + v1.y * v2.y + v1.z * v2.z
+
+    import numpy as np
+
+    result: npt.NDArray[np.float64] = np.einsum("...i,...i->...", v1, v2)
+    return result
 
 
-def cross(v1: Vector3, v2: Vector3) -> Vector3:
-    return v1.cross(v2)
+def cross(
+    v1: "Vector3 | npt.NDArray[np.float64]", v2: "Vector3 | npt.NDArray[np.float64]"
+) -> "Vector3 | npt.NDArray[np.float64]":
+    """
+    Calculates cross products of two vectors, or row-wise of two (N, 3) arrays.
+    """
+    if isinstance(v1, Vector3) and isinstance(v2, Vector3):
+        return v1.cross(v2)
+
+    import numpy as np
 
+    result: npt.NDArray[np.float64] = np.cross(v1, v2)
+    return result
 
-def angle(v1: Vector3, v2: Vector3, unit: str = "rad") -> float:
+
+def angle(
+    v1: "Vector3 | npt.NDArray[np.float64]",
+    v2: "Vector3 | npt.NDArray[np.float64]",
+    unit: str = "rad",
+) -> "float | npt.NDArray[np.float64]":
     """
     Calculates angle from two vectors.
 
     Parameters
     ----------
-    v1, v2: Vector3
-        2 vector of class Vector3.
+    v1, v2: Vector3 | np.ndarray
+        2 vector of class Vector3, or 2 arrays of shape (N, 3) holding
+        vectors as rows.
     unit: str ('deg' | 'rad')
         The unit of angle. Default: 'rad'
 
     Returns
     -------
-    angle: float
-        Angle between two vectors.
+    angle: float | np.ndarray
+        Angle between two vectors, or array of shape (N,) with the angles
+        between the rows.
     """
     if isinstance(unit, str):
-        length_v1 = v1.norm()
-        length_v2 = v2.norm()
-        angle = acos(v1.dot(v2) / (length_v1 * length_v2))
+        if not (isinstance(v1, Vector3) and isinstance(v2, Vector3)):
+            import numpy as np
+
+            a1 = np.asarray(v1, dtype=np.float64)
+            a2 = np.asarray(v2, dtype=np.float64)
+            length_v1 = np.linalg.norm(a1, axis=-1)
+            length_v2 = np.linalg.norm(a2, axis=-1)
+            angle: float | npt.NDArray[np.float64] = np.arccos(
+                dot(a1, a2) / (length_v1 * length_v2)
+            )
+        else:
+            length_v1 = v1.norm()
+            length_v2 = v2.norm()
+            angle = acos(dot(v1, v2) / (length_v1 * length_v2))
         if unit == "deg":
             return angle * 180 / pi
         elif unit == "rad":
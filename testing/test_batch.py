@@ -0,0 +1,159 @@
+from math import pi
+
+import numpy as np
+import pytest
+from assert_equal import assert_obj_equal
+
+from quaternion import batch
+from quaternion.batch import QuaternionArray, multiply_batch, rotate_vectors_batch
+from quaternion.quaternion import Quaternion
+from quaternion.vector3 import Vector3
+
+
+def test_multiply_batch():
+    p = np.array([[1, 2, 3, 4], [-4, 3, -2, 1]], dtype=np.float64)
+    q = np.array([[-4, 3, -2, 1], [1, 2, 3, 4]], dtype=np.float64)
+
+    np.testing.assert_allclose(
+        multiply_batch(p, q), np.array([[-8, 6, -4, -28], [-8, -16, -24, -2]])
+    )
+
+
+def test_rotate_vectors_batch():
+    q1 = Quaternion(1, 2, 3, 4)
+    q2 = Quaternion(1, 2, 3, 4).normalize()
+    v1 = Vector3(2, 2, 2)
+    v2 = Vector3(-1, 0.5, 3)
+
+    q = np.stack([q1.to_array(), q2.to_array()])
+    v = np.array([v1.get(), v2.get()], dtype=np.float64)
+
+    np.testing.assert_allclose(
+        rotate_vectors_batch(q, v),
+        np.array([q1.transform(v1).get(), q2.transform(v2).get()]),
+    )
+
+
+def test_array_conversion():
+    q = Quaternion(1, 2, 3, 4)
+
+    np.testing.assert_array_equal(q.to_array(), np.array([1.0, 2.0, 3.0, 4.0]))
+    assert Quaternion.from_array(q.to_array()).get() == (1.0, 2.0, 3.0, 4.0)
+
+
+def test_quaternion_array():
+    q1 = Quaternion(1, 2, 3, 4)
+    q2 = Quaternion(-4, 3, -2, 1)
+    qa = QuaternionArray.from_list([q1, q2])
+    qb = QuaternionArray.from_list([q2, q1])
+
+    assert len(qa) == 2
+    assert list(qa.iter()) == [q1, q2]
+
+    for actual, expected in zip(qa.multiply(qb).iter(), [q1 * q2, q2 * q1]):
+        assert_obj_equal(actual, expected)
+
+    for actual, expected in zip(
+        qa.normalize().iter(), [q1.normalize(), q2.normalize()]
+    ):
+        assert_obj_equal(actual, expected)
+
+    v1 = Vector3(2, 2, 2)
+    v2 = Vector3(-1, 0.5, 3)
+    v = np.array([v1.get(), v2.get()], dtype=np.float64)
+
+    np.testing.assert_allclose(
+        qa.rotate(v), np.array([q1.transform(v1).get(), q2.transform(v2).get()])
+    )
+
+
+def test_quaternion_array_float32():
+    q1 = Quaternion(1, 2, 3, 4)
+    q2 = Quaternion(-4, 3, -2, 1)
+    qa = QuaternionArray.from_list([q1, q2], dtype=np.float32)
+    qb = QuaternionArray.from_list([q2, q1], dtype=np.float32)
+
+    assert qa.dtype == np.float32
+    assert qa.multiply(qb).dtype == np.float32
+    assert qa.normalize().dtype == np.float32
+
+    product = qa.multiply(qb)
+    np.testing.assert_allclose(product.w, [-8, -8])
+    np.testing.assert_allclose(product.x, [6, -16])
+    np.testing.assert_allclose(product.y, [-4, -24])
+    np.testing.assert_allclose(product.z, [-28, -2])
+
+    p = np.array([q1.get(), q2.get()], dtype=np.float32)
+    assert multiply_batch(p, p).dtype == np.float32
+
+
+def test_rotate_vectors_batch_single_quaternion(monkeypatch):
+    q = Quaternion(1, 2, 3, 4)
+    v1 = Vector3(2, 2, 2)
+    v2 = Vector3(-1, 0.5, 3)
+
+    v = np.array([v1.get(), v2.get()], dtype=np.float64)
+    expected = np.array([q.transform(v1).get(), q.transform(v2).get()])
+
+    q_int = np.array([1, 2, 3, 4])
+    v_int = np.array([[2, 2, 2], [-1, 0, 3]])
+    expected_int = np.array(
+        [q.transform(Vector3(2, 2, 2)).get(), q.transform(Vector3(-1, 0, 3)).get()]
+    )
+
+    # Numba kernel, then the NumPy fallback used without Numba
+    for has_numba in (True, False):
+        monkeypatch.setattr(batch, "HAS_NUMBA", has_numba)
+
+        np.testing.assert_allclose(rotate_vectors_batch(q.to_array(), v), expected)
+
+        # integer inputs give floating results instead of truncated ones
+        rotated = rotate_vectors_batch(q_int, v_int)
+        assert rotated.dtype == np.float64
+        np.testing.assert_allclose(rotated, expected_int)
+
+        with pytest.raises(OverflowError):
+            rotate_vectors_batch(np.array([1e200, 1e200, 0.0, 0.0]), v)
+
+
+def test_from_axis_angles():
+    axis = Vector3(1, -2, 2)
+    angles = np.array([0.0, pi / 3, -2.5])
+
+    qa = QuaternionArray.from_axis_angles(axis, angles)
+
+    for actual, angle in zip(qa.iter(), angles.tolist()):
+        assert_obj_equal(actual, Quaternion.from_axis_angle(axis, angle))
+
+    assert (
+        QuaternionArray.from_axis_angles(axis, angles, np.float32).dtype == np.float32
+    )
+
+    # squaring the axis components would overflow
+    large_axis = Vector3(0, 0, 1e200)
+    qa = QuaternionArray.from_axis_angles(large_axis, angles)
+
+    for actual, angle in zip(qa.iter(), angles.tolist()):
+        assert_obj_equal(actual, Quaternion.from_axis_angle(large_axis, angle))
+
+
+def test_quaternion_array_multiply_shapes(monkeypatch):
+    qa = QuaternionArray([1, 2, 3], [0, 1, 0], [0, 0, 1], [1, 0, 0])
+    qb = QuaternionArray([2], [1], [0], [0])
+    qc = QuaternionArray([2, 1], [1, 0], [0, 1], [0, 0])
+    q0 = QuaternionArray(1, 0, 0, 0)
+
+    expected = [q * Quaternion(2, 1, 0, 0) for q in qa.iter()]
+
+    for has_numba in (True, False):
+        monkeypatch.setattr(batch, "HAS_NUMBA", has_numba)
+
+        # length-1 and 0-d operands broadcast
+        for actual, q in zip(qa.multiply(qb).iter(), expected):
+            assert_obj_equal(actual, q)
+        for actual, q in zip(qb.multiply(qa).iter(), qa.iter()):
+            assert_obj_equal(actual, Quaternion(2, 1, 0, 0) * q)
+        assert q0.multiply(q0).w.tolist() == 1.0
+
+        with pytest.raises(ValueError):
+            qa.multiply(qc)
@@ -0,0 +1,18 @@
+import numpy as np
+
+from quaternion.cuda import rotate_vectors_cuda
+from quaternion.quaternion import Quaternion
+from quaternion.vector3 import Vector3
+
+
+def test_rotate_vectors_cuda():
+    q = Quaternion(1, 2, 3, 4)
+    v1 = Vector3(2, 2, 2)
+    v2 = Vector3(-1, 0.5, 3)
+
+    v = np.array([v1.get(), v2.get()], dtype=np.float64)
+
+    np.testing.assert_allclose(
+        rotate_vectors_cuda(q, v),
+        np.array([q.transform(v1).get(), q.transform(v2).get()]),
+    )
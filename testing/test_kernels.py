@@ -0,0 +1,58 @@
+import pytest
+
+from quaternion import _kernels
+
+# The Cython extension is not built by running pytest on the source tree, so
+# these tests are skipped unless it was built first, with
+# `python setup.py build_ext --inplace` or `pip install .`.
+_ckernels = pytest.importorskip("quaternion._ckernels")
+
+
+@pytest.mark.parametrize(
+    "name, args",
+    [
+        ("qmul", (1, 2, 3, 4, -4, 3, -2, 1)),
+        ("qmul", (1.5, -2, 0.25, 4, 10**20, 0, 0, 0)),
+        ("qinverse", (1, 2, 3, 4)),
+        ("qnormalize", (1, 2, 3, 4)),
+        ("qnormalize", (1e200, -1e200, 0, 1)),
+        ("rotate_vec3", (1, 2, 3, 4, 2, 2, 2)),
+        ("rotate_vec3", (0.5, 0.5, 0.5, 0.5, -1, 0.5, 3)),
+        ("rotate_vec3_unit", (0.5, 0.5, 0.5, 0.5, -1, 0.5, 3)),
+    ],
+)
+def test_backend_parity(name, args):
+    expected = getattr(_kernels, name)(*args)
+    actual = getattr(_ckernels, name)(*args)
+
+    assert actual == pytest.approx(expected, rel=1e-12)
+    assert [type(c) for c in actual] == [type(c) for c in expected]
+
+
+@pytest.mark.parametrize(
+    "name, args",
+    [
+        ("qinverse", (0, 0, 0, 0)),
+        ("qnormalize", (0, 0, 0, 0)),
+        ("rotate_vec3", (0, 0, 0, 0, 1, 2, 3)),
+    ],
+)
+def test_backend_zero_division(name, args):
+    with pytest.raises(ZeroDivisionError):
+        getattr(_kernels, name)(*args)
+    with pytest.raises(ZeroDivisionError):
+        getattr(_ckernels, name)(*args)
+
+
+@pytest.mark.parametrize(
+    "name, args",
+    [
+        ("qinverse", (1e200, 1e200, 0, 0)),
+        ("rotate_vec3", (1e200, 1e200, 0, 0, 0, 1, 0)),
+    ],
+)
+def test_backend_overflow(name, args):
+    with pytest.raises(OverflowError):
+        getattr(_kernels, name)(*args)
+    with pytest.raises(OverflowError):
+        getattr(_ckernels, name)(*args)
@@ -1,8 +1,9 @@
 from math import pi, sqrt
 
+import pytest
 from assert_equal import assert_obj_equal, assert_val_equal
 
-from quaternion.quaternion import Quaternion
+from quaternion.quaternion import Quaternion, UnitQuaternion
 from quaternion.vector3 import Vector3
 
 
@@ -35,6 +36,9 @@ def test_normalize():
 
     assert_obj_equal(q.normalize(), Quaternion(w / norm, x / norm, y / norm, z / norm))
 
+    # |q|^2 overflows a float, |q| does not
+    assert_obj_equal(Quaternion(1e200, 0, 0, 0).normalize(), Quaternion(1, 0, 0, 0))
+
 
 def test_add():
     w1, x1, y1, z1 = 1, 2, 3, 4
@@ -83,6 +87,12 @@ def test_multiply():
 
     assert_obj_equal(q1 * v, Quaternion(-18, 0, 6, 0))
 
+    # components beyond the int64 range
+    assert_obj_equal(
+        Quaternion(10**20, 0, 0, 0) * Quaternion(1, 0, 0, 0),
+        Quaternion(10**20, 0, 0, 0),
+    )
+
 
 def test_inverse():
     w1, x1, y1, z1 = 1, 2, 3, 4
@@ -100,6 +110,9 @@ def test_inverse():
         ),
     )
 
+    with pytest.raises(OverflowError):
+        Quaternion(1e200, 1e200, 0, 0).inverse()
+
 
 def test_transform():
     w1, x1, y1, z1 = 1, 2, 3, 4
@@ -112,7 +125,62 @@ def test_transform():
     q_v = Quaternion(0, v.x, v.y, v.z)
 
     assert_obj_equal(q1.transform(v), Vector3(0.3999999999999999, 2.0, 2.8))
+    assert_obj_equal(q1_normalized.transform(v), Vector3(0.3999999999999999, 2.0, 2.8))
     assert_obj_equal(
         (q1_normalized * q_v * q1_conjugate).vector_part,
         Vector3(0.3999999999999999, 2.0, 2.8),
     )
+
+    with pytest.raises(OverflowError):
+        Quaternion(1e200, 1e200, 0, 0).transform(Vector3(0, 1, 0))
+
+
+def test_comparison():
+    w1, x1, y1, z1 = 1, 2, 3, 4
+    q1 = Quaternion(w1, x1, y1, z1)
+
+    w2, x2, y2, z2 = 1.0, 2.0, 3.0, 4.0
+    q2 = Quaternion(w2, x2, y2, z2)
+
+    q3 = Quaternion(w1, x1, y1, -z1)
+
+    assert q1 == q2
+    assert q1 != q3
+    assert q1.approx_equal(Quaternion(w1, x1, y1, z1 + 1e-12))
+    assert not q1.approx_equal(Quaternion(w1, x1, y1, z1 + 1e-6))
+
+
+def test_from_axis_angle():
+    angle = pi / 3
+
+    q1 = Quaternion.from_axis_angle(Vector3(0, 0, 1), angle)
+    q2 = Quaternion.from_axis_angle(Vector3(0, 0, 5), angle)
+
+    expected = Quaternion(sqrt(3) / 2, 0, 0, 0.5)
+
+    assert isinstance(q1, UnitQuaternion)
+    assert isinstance(q1.copy(), UnitQuaternion)
+    assert_obj_equal(q1, expected)
+    assert_obj_equal(q2, expected)
+    assert_obj_equal(Quaternion.from_axis_angle(Vector3(0, 0, 1e200), angle), expected)
+    assert_obj_equal(q1.transform(Vector3(1, 0, 0)), Vector3(0.5, sqrt(3) / 2, 0))
+
+
+def test_to_string():
+    q = Quaternion(1, -2.555, 3, -4)
+
+    assert str(q) == "1.00 - 2.56i + 3.00j - 4.00k"
+    assert q._toString(1) == "1.0 - 2.6i + 3.0j - 4.0k"
+
+
+def test_multiply_subclass_override():
+    class DoubledScale(Quaternion):
+        __slots__ = ()
+
+        def scale(self, factor):
+            return Quaternion.scale(self, 2 * factor)
+
+    q = DoubledScale(1, 2, 3, 4)
+
+    assert_obj_equal(q * 2, Quaternion(4, 8, 12, 16))
+    assert_obj_equal(q * True, Quaternion(2, 4, 6, 8))
@@ -1,8 +1,10 @@
 from math import pi, sqrt
 
+import numpy as np
+import pytest
 from assert_equal import assert_obj_equal, assert_val_equal
 
-from quaternion.vector3 import Vector3
+from quaternion.vector3 import Vector3, angle, cross, dot
 
 
 def test_norms():
@@ -30,6 +32,9 @@ def test_normalize():
 
     assert_obj_equal(v.normalize(), Vector3(x / length, y / length, z / length))
 
+    # squaring these components would overflow
+    assert_obj_equal(Vector3(1e200, 0, 0).normalize(), Vector3(1, 0, 0))
+
 
 def test_dot():
     x1 = 5.2
@@ -101,3 +106,37 @@ def test_comparison():
     v2 = Vector3(x2, y2, z2)
 
     assert_val_equal(v1 == v2, True)
+
+
+def test_module_functions():
+    v1 = Vector3(5.2, 2.7, -8.3)
+    v2 = Vector3(-0.2, 1.5, -4.4)
+
+    assert_val_equal(dot(v1, v2), v1.dot(v2))
+    assert_obj_equal(cross(v1, v2), v1.cross(v2))
+    assert_val_equal(angle(v1, v2, "deg"), v1.angle(v2, "deg"))
+
+    # row-wise on (N, 3) arrays
+    a1 = np.array([v1, v2])
+    a2 = np.array([v2, v1])
+
+    np.testing.assert_allclose(dot(a1, a2), [v1.dot(v2), v2.dot(v1)])
+    np.testing.assert_allclose(cross(a1, a2), [v1.cross(v2).get(), v2.cross(v1).get()])
+    np.testing.assert_allclose(angle(a1, a2), [v1.angle(v2), v2.angle(v1)])
+
+
+def test_array_protocol():
+    v = Vector3(1, 2, 3)
+
+    np.testing.assert_array_equal(np.asarray(v, dtype=np.float64), [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(np.array(v, copy=True), [1, 2, 3])
+
+    with pytest.raises(ValueError):
+        np.array(v, copy=False)
+
+
+def test_to_string():
+    v = Vector3(-1, 2.345, -3)
+
+    assert str(v) == "-1.00e_x + 2.35e_y - 3.00e_z"
+    assert v._to_string(1) == "-1.0e_x + 2.3e_y - 3.0e_z"